@@ -3,40 +3,530 @@
 Enhanced MCP Server with Pesticide and Seed Information Tool
 """
 import asyncio
-import json
+import logging
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 import httpx
+import ijson
+import msgspec
+import orjson
+from cachetools import TTLCache
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-# Set encoding for Windows to prevent Emoji crashes
-if sys.platform == "win32":
-    sys.stdout.reconfigure(encoding='utf-8')
-    sys.stderr.reconfigure(encoding='utf-8')
-
 # Initialize MCP server
 mcp_server = Server("agricultural-server")
 
+# Interned tool names and argument keys so dispatch and argument lookups
+# compare by pointer identity instead of re-hashing the strings each call
+_NAME_WEATHER = sys.intern("get_current_weather")
+_NAME_POSTS = sys.intern("get_placeholder_posts")
+_NAME_PESTICIDE = sys.intern("get_pesticide_seed_info")
+_KEY_CITY = sys.intern("city")
+_KEY_LIMIT = sys.intern("limit")
+_KEY_QUERY = sys.intern("query")
+
+# Queue-backed logger so log writes never block the event loop; the queue is
+# drained to stderr by a background thread started in main()
+logger = logging.getLogger("mcp")
+
+def setup_logging() -> QueueListener:
+    """Route logger output through a queue to a background stderr writer"""
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.DEBUG)
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+    listener.start()
+    return listener
+
+# Shared HTTP client - created once in main() so every tool call reuses
+# warm keep-alive connections instead of paying a TCP+TLS handshake per call
+HTTP_CLIENT: httpx.AsyncClient | None = None
+
+# Per-endpoint timeouts, kept in one place. wttr.in gets tight per-phase
+# limits so a stuck connection fails fast instead of pinning a pool slot
+TIMEOUTS = {
+    "wttr.in": httpx.Timeout(connect=3.0, read=8.0, write=3.0, pool=2.0),
+    "jsonplaceholder": httpx.Timeout(10.0),
+}
+
+_RETRY_BACKOFF = 0.2
+
+# Short-lived weather cache so repeated lookups for the same city skip the
+# network entirely; in-flight futures coalesce concurrent fetches into one call
+_weather_cache: TTLCache = TTLCache(maxsize=512, ttl=180)
+_in_flight: dict[str, asyncio.Future] = {}
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient (must be created by main() first)"""
+    if HTTP_CLIENT is None:
+        raise RuntimeError("HTTP client not initialized - server not started via main()")
+    return HTTP_CLIENT
+
+async def _get_with_retries(url: str, timeout: httpx.Timeout, retries: int = 2) -> httpx.Response:
+    """GET with exponential backoff on transport errors and 5xx responses"""
+    client = get_http_client()
+    for attempt in range(retries + 1):
+        try:
+            response = await client.get(url, timeout=timeout)
+            if response.status_code < 500 or attempt == retries:
+                return response
+            logger.warning("GET %s returned %s, retrying", url, response.status_code)
+        except httpx.TransportError as e:
+            if attempt == retries:
+                raise
+            logger.warning("GET %s failed (%s), retrying", url, e)
+        await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
 async def fetch_weather_data(city: str) -> dict:
-    """Fetch weather data from wttr.in API"""
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True, verify=False) as client:
+    """Fetch weather data from wttr.in API (cached for a few minutes per city)"""
+    key = city.strip().lower()
+    cached = _weather_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Single-flight: if a fetch for this city is already running, wait for
+    # its result instead of firing another upstream request
+    pending = _in_flight.get(key)
+    if pending is not None:
+        return await pending
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _in_flight[key] = future
+    try:
         try:
             url = f"https://wttr.in/{city}?format=j1"
-            headers = {"User-Agent": "Mozilla/5.0"}
-            response = await client.get(url, headers=headers)
-            print(f"DEBUG: wttr.in returned {response.status_code}", file=sys.stderr)
-            response.raise_for_status()
-            return response.json()
+            response = await _get_with_retries(url, TIMEOUTS["wttr.in"])
+            logger.debug("wttr.in returned %s", response.status_code)
+            # Inline status check, then parse the body in one pass
+            if response.status_code >= 400:
+                raise Exception(f"wttr.in returned HTTP {response.status_code}")
+            data = orjson.loads(response.content)
+            _weather_cache[key] = data
+            future.set_result(data)
+            return data
         except Exception as e:
-            print(f"API Error: {str(e)}", file=sys.stderr)
-            raise Exception(f"Failed to fetch weather data: {str(e)}")
+            logger.error("API Error: %s", e)
+            error = Exception(f"Failed to fetch weather data: {str(e)}")
+            future.set_exception(error)
+            future.exception()  # mark retrieved in case nobody else is waiting
+            raise error
+    finally:
+        # If the leader was cancelled mid-fetch the future is still pending;
+        # cancel it so coalesced waiters are released instead of hanging
+        if not future.done():
+            future.cancel()
+        _in_flight.pop(key, None)
 
-@mcp_server.list_tools()
-async def list_tools() -> list[Tool]:
-    """Register all available tools"""
-    return [
+# Static template for the weather reply; filled in with one format pass per call
+_WEATHER_TMPL = (
+    "🌤️  Current Weather in {city}:\n"
+    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    "Temperature: {temp}°C\n"
+    "Condition: {cond}\n"
+    "Humidity: {hum}%\n"
+    "Wind Speed: {wind} km/h"
+)
+
+_POSTS_URL = "https://jsonplaceholder.typicode.com/posts"
+
+# Below this limit, streaming + early abort parses far fewer bytes than a
+# full download; above it the whole 100-post array is needed anyway
+_POSTS_STREAM_THRESHOLD = 50
+
+class Post(msgspec.Struct):
+    """Typed view of a jsonplaceholder post; decoded without per-field dict hashing"""
+    id: int
+    title: str
+    body: str
+
+class _AsyncResponseReader:
+    """Minimal async file-like wrapper feeding httpx response bytes to ijson"""
+
+    def __init__(self, aiter):
+        self._aiter = aiter
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to sniff str-vs-bytes and discards the
+        # result; answering from the iterator would drop the first chunk
+        if size == 0:
+            return b""
+        try:
+            return await self._aiter.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+async def fetch_posts(limit: int) -> list[Post]:
+    """Fetch up to `limit` posts, aborting the response early for small limits"""
+    if limit <= 0:
+        return []
+
+    client = get_http_client()
+
+    if limit >= _POSTS_STREAM_THRESHOLD:
+        response = await client.get(_POSTS_URL, timeout=TIMEOUTS["jsonplaceholder"])
+        if response.status_code >= 400:
+            raise Exception(f"jsonplaceholder returned HTTP {response.status_code}")
+        return msgspec.json.decode(response.content, type=list[Post])[:limit]
+
+    posts: list[Post] = []
+    async with client.stream("GET", _POSTS_URL, timeout=TIMEOUTS["jsonplaceholder"]) as response:
+        if response.status_code >= 400:
+            raise Exception(f"jsonplaceholder returned HTTP {response.status_code}")
+        reader = _AsyncResponseReader(response.aiter_bytes())
+        async for item in ijson.items_async(reader, "item"):
+            posts.append(msgspec.convert(item, type=Post, strict=False))
+            if len(posts) >= limit:
+                break
+    return posts
+
+# The pesticide/seed response is static apart from the user's query, so the
+# surrounding text is built once here instead of re-concatenated per call
+_PESTICIDE_PREFIX = (
+    "🌾 Welcome to Pesticide and Seed Information Service! 🌱\n"
+    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "Query: "
+)
+
+_PESTICIDE_SUFFIX = (
+    "\n\n"
+    "I will fetch comprehensive information about seeds and pesticides for you!\n\n"
+    "📋 Services Available:\n"
+    "  • Seed recommendations for different crops\n"
+    "  • Organic and chemical pesticide information\n"
+    "  • Seasonal planting guides\n"
+    "  • Pest identification and treatment\n"
+    "  • Fertilizer recommendations\n"
+    "  • Crop rotation strategies\n\n"
+    "🔜 Coming Soon:\n"
+    "  - Real-time pest alerts\n"
+    "  - Seed supplier database\n"
+    "  - Pesticide safety guidelines\n"
+    "  - Crop yield predictions\n\n"
+    "💡 Tip: Ask me about specific crops, pests, or farming techniques!"
+    "Pesticide Practices for Citrus Cultivation in India\n"
+    "Focus Crop: Mosambi (Sweet Lemon)\n"
+    "1. Introduction: Importance of Pest Management in Citrus\n"
+    "\n"
+    "Citrus crops such as Mosambi (Sweet Lemon) are economically important fruit crops cultivated widely across India, especially in Maharashtra, Telangana, Andhra Pradesh, Madhya Pradesh, and parts of North India. These crops are high-value, long-duration perennial plants, meaning that pest and disease pressure accumulates over multiple seasons if not managed properly.\n"
+    "\n"
+    "Pests in citrus affect:\n"
+    "\n"
+    "Leaf health (photosynthesis)\n"
+    "\n"
+    "Flowering and fruit set\n"
+    "\n"
+    "Fruit quality and size\n"
+    "\n"
+    "Tree longevity and yield consistency\n"
+    "\n"
+    "Because citrus orchards remain productive for 15–25 years, improper pesticide use can lead to:\n"
+    "\n"
+    "Pest resistance\n"
+    "\n"
+    "Soil and water contamination\n"
+    "\n"
+    "Loss of beneficial insects\n"
+    "\n"
+    "Higher long-term costs for farmers\n"
+    "\n"
+    "Hence, scientific, need-based pesticide application is critical.\n"
+    "\n"
+    "2. Major Insect Pests in Mosambi and Commonly Used Pesticides\n"
+    "2.1 Citrus Psylla (Diaphorina citri)\n"
+    "\n"
+    "Nature of Damage\n"
+    "\n"
+    "Sucks sap from tender leaves and shoots\n"
+    "\n"
+    "Causes leaf curling and stunted growth\n"
+    "\n"
+    "Major vector of Citrus Greening (HLB) disease\n"
+    "\n"
+    "Season of Occurrence\n"
+    "\n"
+    "Peak during new flush (Feb–March, July–September)\n"
+    "\n"
+    "Commonly Used Pesticides\n"
+    "\n"
+    "Imidacloprid 17.8% SL (soil drenching or foliar spray)\n"
+    "\n"
+    "Thiamethoxam 25% WG\n"
+    "\n"
+    "Acetamiprid 20% SP\n"
+    "\n"
+    "Application Notes\n"
+    "\n"
+    "Avoid spraying during flowering\n"
+    "\n"
+    "Prefer soil drenching to reduce impact on pollinators\n"
+    "\n"
+    "Rotate molecules to prevent resistance\n"
+    "\n"
+    "2.2 Citrus Leaf Miner\n"
+    "\n"
+    "Nature of Damage\n"
+    "\n"
+    "Larvae create zig-zag tunnels in young leaves\n"
+    "\n"
+    "Severely affects nursery plants and young orchards\n"
+    "\n"
+    "Increases susceptibility to citrus canker\n"
+    "\n"
+    "Season of Occurrence\n"
+    "\n"
+    "High during monsoon and post-monsoon flush\n"
+    "\n"
+    "Commonly Used Pesticides\n"
+    "\n"
+    "Abamectin 1.9% EC\n"
+    "\n"
+    "Spinosad 45% SC\n"
+    "\n"
+    "Emamectin benzoate 5% SG\n"
+    "\n"
+    "Integrated Practice\n"
+    "\n"
+    "Spray only during active leaf flush\n"
+    "\n"
+    "Avoid repeated spraying on mature leaves\n"
+    "\n"
+    "2.3 Aphids\n"
+    "\n"
+    "Nature of Damage\n"
+    "\n"
+    "Sap sucking leads to leaf distortion\n"
+    "\n"
+    "Produces honeydew, encouraging sooty mold\n"
+    "\n"
+    "Transmits viral diseases\n"
+    "\n"
+    "Commonly Used Pesticides\n"
+    "\n"
+    "Dimethoate 30% EC\n"
+    "\n"
+    "Imidacloprid 17.8% SL\n"
+    "\n"
+    "Flonicamid 50% WG\n"
+    "\n"
+    "Precautions\n"
+    "\n"
+    "Monitor colonies before spraying\n"
+    "\n"
+    "Avoid overuse of organophosphates\n"
+    "\n"
+    "2.4 Mealybugs\n"
+    "\n"
+    "Nature of Damage\n"
+    "\n"
+    "Attacks shoots, leaves, fruits, and roots\n"
+    "\n"
+    "Causes fruit drop and plant weakening\n"
+    "\n"
+    "Severe infestation can kill young trees\n"
+    "\n"
+    "Commonly Used Pesticides\n"
+    "\n"
+    "Chlorpyrifos 20% EC (restricted use, soil application)\n"
+    "\n"
+    "Buprofezin 25% SC\n"
+    "\n"
+    "Spirotetramat 15.31% OD\n"
+    "\n"
+    "Additional Measures\n"
+    "\n"
+    "Use sticky bands on trunks\n"
+    "\n"
+    "Control ants that spread mealybugs\n"
+    "\n"
+    "2.5 Red Spider Mites\n"
+    "\n"
+    "Nature of Damage\n"
+    "\n"
+    "Yellow speckling on leaves\n"
+    "\n"
+    "Leaf bronzing and premature leaf fall\n"
+    "\n"
+    "Reduced fruit size and juice content\n"
+    "\n"
+    "Commonly Used Acaricides\n"
+    "\n"
+    "Propargite 57% EC\n"
+    "\n"
+    "Fenazaquin 10% EC\n"
+    "\n"
+    "Hexythiazox 5% EC\n"
+    "\n"
+    "Best Practice\n"
+    "\n"
+    "Spray early during infestation\n"
+    "\n"
+    "Ensure proper spray coverage on leaf undersides\n"
+    "\n"
+    "3. Major Diseases and Fungicide Usage in Citrus\n"
+    "3.1 Citrus Canker (Bacterial Disease)\n"
+    "\n"
+    "Symptoms\n"
+    "\n"
+    "Raised corky lesions on leaves, stems, and fruits\n"
+    "\n"
+    "Fruit drop and market rejection\n"
+    "\n"
+    "Common Chemicals Used\n"
+    "\n"
+    "Copper oxychloride 50% WP\n"
+    "\n"
+    "Streptocycline (with copper fungicide)\n"
+    "\n"
+    "Bordeaux mixture (1%)\n"
+    "\n"
+    "Management Strategy\n"
+    "\n"
+    "Avoid spraying antibiotics repeatedly\n"
+    "\n"
+    "Focus on sanitation and pruning\n"
+    "\n"
+    "3.2 Phytophthora (Root Rot, Gummosis)\n"
+    "\n"
+    "Symptoms\n"
+    "\n"
+    "Gum oozing from trunk\n"
+    "\n"
+    "Root decay and wilting\n"
+    "\n"
+    "Sudden plant death in severe cases\n"
+    "\n"
+    "Common Fungicides\n"
+    "\n"
+    "Metalaxyl + Mancozeb\n"
+    "\n"
+    "Fosetyl-Al\n"
+    "\n"
+    "Copper-based fungicides (soil drench)\n"
+    "\n"
+    "Preventive Measures\n"
+    "\n"
+    "Proper drainage\n"
+    "\n"
+    "Avoid water stagnation near trunk\n"
+    "\n"
+    "3.3 Powdery Mildew\n"
+    "\n"
+    "Symptoms\n"
+    "\n"
+    "White powdery growth on leaves and flowers\n"
+    "\n"
+    "Reduced fruit set\n"
+    "\n"
+    "Common Fungicides\n"
+    "\n"
+    "Sulphur 80% WP\n"
+    "\n"
+    "Hexaconazole 5% EC\n"
+    "\n"
+    "Penconazole\n"
+    "4. Safe Pesticide Application Practices for Farmers\n"
+    "4.1 Dosage and Timing\n"
+    "\n"
+    "Always follow label-recommended dose\n"
+    "\n"
+    "Spray during early morning or late evening\n"
+    "\n"
+    "Avoid spraying during strong winds or rain\n"
+    "\n"
+    "4.2 Spraying Equipment\n"
+    "\n"
+    "Use cone nozzle for uniform coverage\n"
+    "\n"
+    "Calibrate sprayers regularly\n"
+    "\n"
+    "Separate sprayers for herbicides and insecticides\n"
+    "\n"
+    "4.3 Pre-Harvest Interval (PHI)\n"
+    "\n"
+    "Respect PHI to avoid pesticide residues\n"
+    "\n"
+    "Important for export-quality fruits\n"
+    "\n"
+    "5. Resistance Management and Pesticide Rotation\n"
+    "\n"
+    "Overuse of the same pesticide leads to resistance development, making future control difficult.\n"
+    "\n"
+    "Best Practices\n"
+    "\n"
+    "Rotate pesticides with different modes of action\n"
+    "\n"
+    "Avoid more than 2 consecutive sprays of the same chemical group\n"
+    "\n"
+    "Combine chemical control with biological methods\n"
+    "\n"
+    "6. Role of Integrated Pest Management (IPM)\n"
+    "\n"
+    "Chemical pesticides should be part of a broader IPM strategy, including:\n"
+    "\n"
+    "Regular orchard monitoring\n"
+    "\n"
+    "Use of pheromone traps\n"
+    "\n"
+    "Conservation of beneficial insects (ladybird beetles, lacewings)\n"
+    "\n"
+    "Neem-based products (Azadirachtin)\n"
+    "\n"
+    "IPM reduces:\n"
+    "\n"
+    "Input costs\n"
+    "\n"
+    "Environmental damage\n"
+    "\n"
+    "Health risks to farmers\n"
+    "\n"
+    "7. Regulatory and Environmental Considerations\n"
+    "\n"
+    "Several pesticides are restricted or banned if misused\n"
+    "\n"
+    "Excessive residues can lead to rejection in domestic and export markets\n"
+    "\n"
+    "Farmers should stay updated via:\n"
+    "\n"
+    "State agriculture departments\n"
+    "\n"
+    "Krishi Vigyan Kendras (KVKs)\n"
+    "\n"
+    "Authorized agri-input dealers\n"
+    "\n"
+    "8. Conclusion\n"
+    "\n"
+    "Pesticide use in Mosambi cultivation must be scientific, minimal, and need-based. While pesticides play a vital role in protecting citrus crops from pests and diseases, indiscriminate spraying harms both productivity and sustainability.\n"
+    "\n"
+    "A well-informed farmer who:\n"
+    "\n"
+    "Identifies pests correctly\n"
+    "\n"
+    "Applies the right chemical at the right time\n"
+    "\n"
+    "Integrates non-chemical practices\n"
+    "\n"
+    "will achieve higher yields, better fruit quality, and long-term orchard health.\n"
+)
+
+# UTF-8 form of the static suffix, encoded once at import. TextContent.text
+# must stay a str (the MCP stdio transport serializes the whole JSON-RPC
+# message itself), so this is for custom serialization helpers that can
+# splice pre-encoded bytes instead of re-encoding ~5KB per call.
+_PESTICIDE_SUFFIX_BYTES = _PESTICIDE_SUFFIX.encode("utf-8")
+
+@lru_cache(maxsize=64)
+def _pesticide_response(query: str) -> TextContent:
+    """Build (and memoize) the full pesticide/seed info response for a query"""
+    return TextContent.model_construct(type="text", text=_PESTICIDE_PREFIX + query + _PESTICIDE_SUFFIX)
+
+# Tool definitions are static, so build them once at import time instead of
+# reconstructing the Tool objects and their schemas on every listing call
+_TOOLS_CACHE = [
         Tool(
             name="get_current_weather",
             description="Get current weather conditions for a specific city or location. Use this when users ask about weather, temperature, or climate.",
@@ -85,384 +575,95 @@ async def list_tools() -> list[Tool]:
         )
     ]
 
+@mcp_server.list_tools()
+async def list_tools() -> list[Tool]:
+    """Register all available tools"""
+    return _TOOLS_CACHE
+
+async def _handle_weather(arguments: Any) -> list[TextContent]:
+    """Handle get_current_weather"""
+    city = arguments.get(_KEY_CITY)
+    try:
+        data = await fetch_weather_data(city)
+        current = data["current_condition"][0]
+        formatted = _WEATHER_TMPL.format(
+            city=city,
+            temp=current["temp_C"],
+            cond=current["weatherDesc"][0]["value"],
+            hum=current["humidity"],
+            wind=current.get("windspeedKmph", "N/A")
+        )
+        return [TextContent.model_construct(type="text", text=formatted)]
+    except Exception as e:
+        return [TextContent.model_construct(type="text", text=f"Error fetching weather: {str(e)}")]
+
+async def _handle_posts(arguments: Any) -> list[TextContent]:
+    """Handle get_placeholder_posts"""
+    limit = arguments.get(_KEY_LIMIT, 5)
+    try:
+        posts = await fetch_posts(limit)
+
+        body = "\n\n".join(
+            f"📝 Post #{p.id}: {p.title}\n{p.body[:100]}..."
+            for p in posts
+        )
+
+        result = f"📚 Fetched {len(posts)} blog posts:\n\n" + body
+        return [TextContent.model_construct(type="text", text=result)]
+    except Exception as e:
+        return [TextContent.model_construct(type="text", text=f"Error fetching posts: {str(e)}")]
+
+async def _handle_pesticide(arguments: Any) -> list[TextContent]:
+    """Handle get_pesticide_seed_info"""
+    query = arguments.get(_KEY_QUERY, "general information")
+    return [_pesticide_response(query)]
+
+_DISPATCH = {
+    _NAME_WEATHER: _handle_weather,
+    _NAME_POSTS: _handle_posts,
+    _NAME_PESTICIDE: _handle_pesticide,
+}
+
 @mcp_server.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Execute the requested tool"""
-    
-    if name == "get_current_weather":
-        city = arguments.get("city")
-        try:
-            data = await fetch_weather_data(city)
-            current = data["current_condition"][0]
-            formatted = (
-                f"🌤️  Current Weather in {city}:\n"
-                f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                f"Temperature: {current['temp_C']}°C\n"
-                f"Condition: {current['weatherDesc'][0]['value']}\n"
-                f"Humidity: {current['humidity']}%\n"
-                f"Wind Speed: {current.get('windspeedKmph', 'N/A')} km/h"
-            )
-            return [TextContent(type="text", text=formatted)]
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error fetching weather: {str(e)}")]
-
-    elif name == "get_placeholder_posts":
-        limit = arguments.get("limit", 5)
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            try:
-                response = await client.get("https://jsonplaceholder.typicode.com/posts")
-                response.raise_for_status()
-                posts = response.json()[:limit]
-                
-                formatted_posts = [
-                    f"📝 Post #{p['id']}: {p['title']}\n{p['body'][:100]}..." 
-                    for p in posts
-                ]
-                
-                result = f"📚 Fetched {len(posts)} blog posts:\n\n" + "\n\n".join(formatted_posts)
-                return [TextContent(type="text", text=result)]
-            except Exception as e:
-                return [TextContent(type="text", text=f"Error fetching posts: {str(e)}")]
-    
-    elif name == "get_pesticide_seed_info":
-        query = arguments.get("query", "general information")
-        
-        # This is a placeholder - in production, you'd fetch from a real database
-        response = (
-            f"🌾 Welcome to Pesticide and Seed Information Service! 🌱\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"Query: {query}\n\n"
-            f"I will fetch comprehensive information about seeds and pesticides for you!\n\n"
-            f"📋 Services Available:\n"
-            f"  • Seed recommendations for different crops\n"
-            f"  • Organic and chemical pesticide information\n"
-            f"  • Seasonal planting guides\n"
-            f"  • Pest identification and treatment\n"
-            f"  • Fertilizer recommendations\n"
-            f"  • Crop rotation strategies\n\n"
-            f"🔜 Coming Soon:\n"
-            f"  - Real-time pest alerts\n"
-            f"  - Seed supplier database\n"
-            f"  - Pesticide safety guidelines\n"
-            f"  - Crop yield predictions\n\n"
-            f"💡 Tip: Ask me about specific crops, pests, or farming techniques!"
-                        f"Pesticide Practices for Citrus Cultivation in India\n"
-            f"Focus Crop: Mosambi (Sweet Lemon)\n"
-            f"1. Introduction: Importance of Pest Management in Citrus\n"
-            f"\n"
-            f"Citrus crops such as Mosambi (Sweet Lemon) are economically important fruit crops cultivated widely across India, especially in Maharashtra, Telangana, Andhra Pradesh, Madhya Pradesh, and parts of North India. These crops are high-value, long-duration perennial plants, meaning that pest and disease pressure accumulates over multiple seasons if not managed properly.\n"
-            f"\n"
-            f"Pests in citrus affect:\n"
-            f"\n"
-            f"Leaf health (photosynthesis)\n"
-            f"\n"
-            f"Flowering and fruit set\n"
-            f"\n"
-            f"Fruit quality and size\n"
-            f"\n"
-            f"Tree longevity and yield consistency\n"
-            f"\n"
-            f"Because citrus orchards remain productive for 15–25 years, improper pesticide use can lead to:\n"
-            f"\n"
-            f"Pest resistance\n"
-            f"\n"
-            f"Soil and water contamination\n"
-            f"\n"
-            f"Loss of beneficial insects\n"
-            f"\n"
-            f"Higher long-term costs for farmers\n"
-            f"\n"
-            f"Hence, scientific, need-based pesticide application is critical.\n"
-            f"\n"
-            f"2. Major Insect Pests in Mosambi and Commonly Used Pesticides\n"
-            f"2.1 Citrus Psylla (Diaphorina citri)\n"
-            f"\n"
-            f"Nature of Damage\n"
-            f"\n"
-            f"Sucks sap from tender leaves and shoots\n"
-            f"\n"
-            f"Causes leaf curling and stunted growth\n"
-            f"\n"
-            f"Major vector of Citrus Greening (HLB) disease\n"
-            f"\n"
-            f"Season of Occurrence\n"
-            f"\n"
-            f"Peak during new flush (Feb–March, July–September)\n"
-            f"\n"
-            f"Commonly Used Pesticides\n"
-            f"\n"
-            f"Imidacloprid 17.8% SL (soil drenching or foliar spray)\n"
-            f"\n"
-            f"Thiamethoxam 25% WG\n"
-            f"\n"
-            f"Acetamiprid 20% SP\n"
-            f"\n"
-            f"Application Notes\n"
-            f"\n"
-            f"Avoid spraying during flowering\n"
-            f"\n"
-            f"Prefer soil drenching to reduce impact on pollinators\n"
-            f"\n"
-            f"Rotate molecules to prevent resistance\n"
-            f"\n"
-            f"2.2 Citrus Leaf Miner\n"
-            f"\n"
-            f"Nature of Damage\n"
-            f"\n"
-            f"Larvae create zig-zag tunnels in young leaves\n"
-            f"\n"
-            f"Severely affects nursery plants and young orchards\n"
-            f"\n"
-            f"Increases susceptibility to citrus canker\n"
-            f"\n"
-            f"Season of Occurrence\n"
-            f"\n"
-            f"High during monsoon and post-monsoon flush\n"
-            f"\n"
-            f"Commonly Used Pesticides\n"
-            f"\n"
-            f"Abamectin 1.9% EC\n"
-            f"\n"
-            f"Spinosad 45% SC\n"
-            f"\n"
-            f"Emamectin benzoate 5% SG\n"
-            f"\n"
-            f"Integrated Practice\n"
-            f"\n"
-            f"Spray only during active leaf flush\n"
-            f"\n"
-            f"Avoid repeated spraying on mature leaves\n"
-            f"\n"
-            f"2.3 Aphids\n"
-            f"\n"
-            f"Nature of Damage\n"
-            f"\n"
-            f"Sap sucking leads to leaf distortion\n"
-            f"\n"
-            f"Produces honeydew, encouraging sooty mold\n"
-            f"\n"
-            f"Transmits viral diseases\n"
-            f"\n"
-            f"Commonly Used Pesticides\n"
-            f"\n"
-            f"Dimethoate 30% EC\n"
-            f"\n"
-            f"Imidacloprid 17.8% SL\n"
-            f"\n"
-            f"Flonicamid 50% WG\n"
-            f"\n"
-            f"Precautions\n"
-            f"\n"
-            f"Monitor colonies before spraying\n"
-            f"\n"
-            f"Avoid overuse of organophosphates\n"
-            f"\n"
-            f"2.4 Mealybugs\n"
-            f"\n"
-            f"Nature of Damage\n"
-            f"\n"
-            f"Attacks shoots, leaves, fruits, and roots\n"
-            f"\n"
-            f"Causes fruit drop and plant weakening\n"
-            f"\n"
-            f"Severe infestation can kill young trees\n"
-            f"\n"
-            f"Commonly Used Pesticides\n"
-            f"\n"
-            f"Chlorpyrifos 20% EC (restricted use, soil application)\n"
-            f"\n"
-            f"Buprofezin 25% SC\n"
-            f"\n"
-            f"Spirotetramat 15.31% OD\n"
-            f"\n"
-            f"Additional Measures\n"
-            f"\n"
-            f"Use sticky bands on trunks\n"
-            f"\n"
-            f"Control ants that spread mealybugs\n"
-            f"\n"
-            f"2.5 Red Spider Mites\n"
-            f"\n"
-            f"Nature of Damage\n"
-            f"\n"
-            f"Yellow speckling on leaves\n"
-            f"\n"
-            f"Leaf bronzing and premature leaf fall\n"
-            f"\n"
-            f"Reduced fruit size and juice content\n"
-            f"\n"
-            f"Commonly Used Acaricides\n"
-            f"\n"
-            f"Propargite 57% EC\n"
-            f"\n"
-            f"Fenazaquin 10% EC\n"
-            f"\n"
-            f"Hexythiazox 5% EC\n"
-            f"\n"
-            f"Best Practice\n"
-            f"\n"
-            f"Spray early during infestation\n"
-            f"\n"
-            f"Ensure proper spray coverage on leaf undersides\n"
-            f"\n"
-            f"3. Major Diseases and Fungicide Usage in Citrus\n"
-            f"3.1 Citrus Canker (Bacterial Disease)\n"
-            f"\n"
-            f"Symptoms\n"
-            f"\n"
-            f"Raised corky lesions on leaves, stems, and fruits\n"
-            f"\n"
-            f"Fruit drop and market rejection\n"
-            f"\n"
-            f"Common Chemicals Used\n"
-            f"\n"
-            f"Copper oxychloride 50% WP\n"
-            f"\n"
-            f"Streptocycline (with copper fungicide)\n"
-            f"\n"
-            f"Bordeaux mixture (1%)\n"
-            f"\n"
-            f"Management Strategy\n"
-            f"\n"
-            f"Avoid spraying antibiotics repeatedly\n"
-            f"\n"
-            f"Focus on sanitation and pruning\n"
-            f"\n"
-            f"3.2 Phytophthora (Root Rot, Gummosis)\n"
-            f"\n"
-            f"Symptoms\n"
-            f"\n"
-            f"Gum oozing from trunk\n"
-            f"\n"
-            f"Root decay and wilting\n"
-            f"\n"
-            f"Sudden plant death in severe cases\n"
-            f"\n"
-            f"Common Fungicides\n"
-            f"\n"
-            f"Metalaxyl + Mancozeb\n"
-            f"\n"
-            f"Fosetyl-Al\n"
-            f"\n"
-            f"Copper-based fungicides (soil drench)\n"
-            f"\n"
-            f"Preventive Measures\n"
-            f"\n"
-            f"Proper drainage\n"
-            f"\n"
-            f"Avoid water stagnation near trunk\n"
-            f"\n"
-            f"3.3 Powdery Mildew\n"
-            f"\n"
-            f"Symptoms\n"
-            f"\n"
-            f"White powdery growth on leaves and flowers\n"
-            f"\n"
-            f"Reduced fruit set\n"
-            f"\n"
-            f"Common Fungicides\n"
-            f"\n"
-            f"Sulphur 80% WP\n"
-            f"\n"
-            f"Hexaconazole 5% EC\n"
-            f"\n"
-            f"Penconazole\n"
-            f"4. Safe Pesticide Application Practices for Farmers\n"
-            f"4.1 Dosage and Timing\n"
-            f"\n"
-            f"Always follow label-recommended dose\n"
-            f"\n"
-            f"Spray during early morning or late evening\n"
-            f"\n"
-            f"Avoid spraying during strong winds or rain\n"
-            f"\n"
-            f"4.2 Spraying Equipment\n"
-            f"\n"
-            f"Use cone nozzle for uniform coverage\n"
-            f"\n"
-            f"Calibrate sprayers regularly\n"
-            f"\n"
-            f"Separate sprayers for herbicides and insecticides\n"
-            f"\n"
-            f"4.3 Pre-Harvest Interval (PHI)\n"
-            f"\n"
-            f"Respect PHI to avoid pesticide residues\n"
-            f"\n"
-            f"Important for export-quality fruits\n"
-            f"\n"
-            f"5. Resistance Management and Pesticide Rotation\n"
-            f"\n"
-            f"Overuse of the same pesticide leads to resistance development, making future control difficult.\n"
-            f"\n"
-            f"Best Practices\n"
-            f"\n"
-            f"Rotate pesticides with different modes of action\n"
-            f"\n"
-            f"Avoid more than 2 consecutive sprays of the same chemical group\n"
-            f"\n"
-            f"Combine chemical control with biological methods\n"
-            f"\n"
-            f"6. Role of Integrated Pest Management (IPM)\n"
-            f"\n"
-            f"Chemical pesticides should be part of a broader IPM strategy, including:\n"
-            f"\n"
-            f"Regular orchard monitoring\n"
-            f"\n"
-            f"Use of pheromone traps\n"
-            f"\n"
-            f"Conservation of beneficial insects (ladybird beetles, lacewings)\n"
-            f"\n"
-            f"Neem-based products (Azadirachtin)\n"
-            f"\n"
-            f"IPM reduces:\n"
-            f"\n"
-            f"Input costs\n"
-            f"\n"
-            f"Environmental damage\n"
-            f"\n"
-            f"Health risks to farmers\n"
-            f"\n"
-            f"7. Regulatory and Environmental Considerations\n"
-            f"\n"
-            f"Several pesticides are restricted or banned if misused\n"
-            f"\n"
-            f"Excessive residues can lead to rejection in domestic and export markets\n"
-            f"\n"
-            f"Farmers should stay updated via:\n"
-            f"\n"
-            f"State agriculture departments\n"
-            f"\n"
-            f"Krishi Vigyan Kendras (KVKs)\n"
-            f"\n"
-            f"Authorized agri-input dealers\n"
-            f"\n"
-            f"8. Conclusion\n"
-            f"\n"
-            f"Pesticide use in Mosambi cultivation must be scientific, minimal, and need-based. While pesticides play a vital role in protecting citrus crops from pests and diseases, indiscriminate spraying harms both productivity and sustainability.\n"
-            f"\n"
-            f"A well-informed farmer who:\n"
-            f"\n"
-            f"Identifies pests correctly\n"
-            f"\n"
-            f"Applies the right chemical at the right time\n"
-            f"\n"
-            f"Integrates non-chemical practices\n"
-            f"\n"
-            f"will achieve higher yields, better fruit quality, and long-term orchard health.\n"
-        )
-        
-        return [TextContent(type="text", text=response)]
-    
-    return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    handler = _DISPATCH.get(name)
+    if handler is None:
+        return [TextContent.model_construct(type="text", text=f"Unknown tool: {name}")]
+    return await handler(arguments)
 
 async def main():
     """Start the MCP server"""
-    async with stdio_server() as (read_stream, write_stream):
-        await mcp_server.run(
-            read_stream,
-            write_stream,
-            mcp_server.create_initialization_options()
-        )
+    global HTTP_CLIENT
+    # Set encoding for Windows to prevent Emoji crashes; done here rather than
+    # at import time so library consumers (tests, tooling) are unaffected
+    if sys.platform == "win32":
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    listener = setup_logging()
+    HTTP_CLIENT = httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        follow_redirects=True,
+        http2=True,
+        verify=True,
+        trust_env=False,
+        headers={"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, br"}
+    )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await mcp_server.run(
+                read_stream,
+                write_stream,
+                mcp_server.create_initialization_options()
+            )
+    finally:
+        await HTTP_CLIENT.aclose()
+        listener.stop()
 
 if __name__ == "__main__":
+    # uvloop is POSIX-only but substantially faster than the default loop
+    if sys.platform != "win32":
+        import uvloop
+        uvloop.install()
     asyncio.run(main())